@@ -0,0 +1,26 @@
+from typing import Iterable, Iterator
+
+# Buffer size for reading and writing the (often multi-MB) UTF-8 text files
+BUFFER_SIZE = 1 << 17
+
+
+def _encode_joined(entries: Iterable[str], separator: bytes) -> Iterator[bytes]:
+    """Yield the UTF-8 encoded entries with separator between consecutive ones."""
+    iterator = iter(entries)
+    for entry in iterator:
+        yield entry.encode("utf-8")
+        break
+    for entry in iterator:
+        yield separator
+        yield entry.encode("utf-8")
+
+
+def write_joined(path, entries: Iterable[str], separator: str = "\n\n") -> None:
+    """
+    Write entries to path as UTF-8, equivalent to writing separator.join(entries).
+
+    The entries are encoded one at a time into a buffered binary file, so the joined
+    text is never built in memory.
+    """
+    with open(path, "wb", buffering=BUFFER_SIZE) as f:
+        f.writelines(_encode_joined(entries, separator.encode("utf-8")))
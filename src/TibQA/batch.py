@@ -0,0 +1,27 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def process_files(
+    func: Callable[..., T],
+    input_files: Iterable,
+    max_workers: Optional[int] = None,
+    chunksize: int = 4,
+) -> List[T]:
+    """
+    Apply func to every input file, spreading the files across worker processes.
+
+    func must be picklable (a module-level function or a functools.partial of
+    one). A single file is processed in the current process, since starting a
+    pool would cost more than it saves.
+    """
+    input_files = list(input_files)
+    if len(input_files) <= 1:
+        return [func(input_file) for input_file in input_files]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(input_files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, input_files, chunksize=chunksize))
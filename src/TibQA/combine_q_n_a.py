@@ -1,35 +1,45 @@
-import json
 import os
+from pathlib import Path
+from typing import Dict
+
+import orjson
+
+from TibQA._io_utils import BUFFER_SIZE
 
 
 def parse_text_file(file_path):
-    # Read the text file and split it into lines
-    with open(file_path, encoding="utf-8") as file:
-        lines = [line.strip() for line in file.readlines() if line.strip()]
+    # Read the text file line by line, keeping only the non-empty stripped lines
+    with open(file_path, encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        lines = [line for line in (raw.strip() for raw in file) if line]
     return lines
 
 
-def combine_question_answer_files(directory):
-    combined_data = []
-    file_statistics = {}  # Dictionary to store the record count per file
-    total_records = 0  # Total number of records across all files
+def iter_qa_pairs(directory, file_statistics=None):
+    """
+    Yield the question-answer pairs of every questions/answers file pair in directory.
+    If a file_statistics dictionary is given, the record count per file is stored in it.
+    """
+    if file_statistics is None:
+        file_statistics = {}
+
+    # Scan the directory once and keep the file paths in memory
+    with os.scandir(directory) as it:
+        entries = {entry.name: entry.path for entry in it if entry.is_file()}
 
     # Loop through all files in the directory
-    for filename in os.listdir(directory):
+    for filename, question_path in entries.items():
         if filename.endswith("_questions.txt"):
-            question_file = filename
-            base_filename = filename.replace("_questions.txt", "")
-            answer_file = base_filename + "_answers.txt"
+            base_filename = filename[: -len("_questions.txt")]
+            answer_path = entries.get(base_filename + "_answers.txt")
 
             # Check if corresponding answer file exists
-            if os.path.exists(os.path.join(directory, answer_file)):
+            if answer_path:
                 # Parse the question and answer files
-                questions = parse_text_file(os.path.join(directory, question_file))
-                answers = parse_text_file(os.path.join(directory, answer_file))
+                questions = parse_text_file(question_path)
+                answers = parse_text_file(answer_path)
 
                 # Get the minimum number of questions and answers (just in case there's a mismatch)
                 record_count = min(len(questions), len(answers))
-                total_records += record_count
 
                 # Store the record count for this file
                 file_statistics[base_filename] = record_count
@@ -41,34 +51,52 @@ def combine_question_answer_files(directory):
                     ]  # Remove indexing from question
                     answer = answers[i].split(" ", 1)[-1]  # Remove indexing from answer
 
-                    qa_pair = {
+                    yield {
                         "question": question,
                         "answer": answer,
                         "filename": base_filename,
                     }
-                    combined_data.append(qa_pair)
+
+
+def combine_question_answer_files(directory):
+    file_statistics: Dict[str, int] = {}  # Record count per file
+    combined_data = list(iter_qa_pairs(directory, file_statistics))
+
+    # Total number of records across all files
+    total_records = sum(file_statistics.values())
 
     return combined_data, total_records, file_statistics
 
 
 def save_to_json(data, output_file):
-    # Save the combined data to a JSON file
-    with open(output_file, "w", encoding="utf-8") as json_file:
-        json.dump(data, json_file, ensure_ascii=False, indent=4)
+    # Save the combined data to a JSON file (orjson writes non-ASCII text as UTF-8)
+    Path(output_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def save_stream(pairs, output_file):
+    """
+    Write pairs to output_file as a JSON array, one record per line, as they are produced.
+    Only the record being serialized is held in memory.
+    """
+    with open(output_file, "wb", buffering=BUFFER_SIZE) as json_file:
+        json_file.write(b"[")
+        separator = b"\n"
+        for pair in pairs:
+            json_file.write(separator)
+            json_file.write(orjson.dumps(pair))
+            separator = b",\n"
+        json_file.write(b"\n]\n")
 
 
 if __name__ == "__main__":
     # Directory where the question and answer files are located
     directory = "data/output"  # Replace with your actual directory path
 
-    # Combine question and answer files
-    combined_data, total_records, file_statistics = combine_question_answer_files(
-        directory
-    )
-
-    # Save the combined data to a JSON file
+    # Stream the combined question-answer pairs into a JSON file
     output_file = "data/output/combined_qa.json"
-    save_to_json(combined_data, output_file)
+    file_statistics: Dict[str, int] = {}
+    save_stream(iter_qa_pairs(directory, file_statistics), output_file)
+    total_records = sum(file_statistics.values())
 
     # Print out statistics
     print(f"Total number of records: {total_records}")
@@ -0,0 +1,114 @@
+import posixpath
+import zipfile
+from typing import Iterator
+
+from lxml import etree
+
+# Package relationships of a .docx file, which name its main document part
+PACKAGE_RELATIONSHIPS = "_rels/.rels"
+RELATIONSHIP = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+OFFICE_DOCUMENT_TYPE_SUFFIX = "/officeDocument"
+DEFAULT_MAIN_PART = "word/document.xml"
+
+# WordprocessingML namespace used by the main document part of a .docx file
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W_NS = f"{{{W_NAMESPACE}}}"
+W_BODY = f"{W_NS}body"
+W_P = f"{W_NS}p"
+W_R = f"{W_NS}r"
+W_T = f"{W_NS}t"
+W_BR = f"{W_NS}br"
+W_HYPERLINK = f"{W_NS}hyperlink"
+W_TYPE = f"{W_NS}type"
+
+# Text of the other run content elements, as python-docx renders them
+_RUN_CONTENT_TEXT = {
+    f"{W_NS}tab": "\t",
+    f"{W_NS}ptab": "\t",
+    f"{W_NS}cr": "\n",
+    f"{W_NS}noBreakHyphen": "-",
+}
+
+
+def _run_text(run) -> str:
+    """Return the text of a w:r element the way python-docx's ``Run.text`` does."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or "")
+        elif tag == W_BR:
+            # Only line breaks are text; page and column breaks are dropped
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            text = _RUN_CONTENT_TEXT.get(tag)
+            if text is not None:
+                parts.append(text)
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Return the text of a w:p element the way python-docx's ``Paragraph.text`` does.
+
+    Only the paragraph's own runs and hyperlink runs are read, so text boxes and
+    other drawings nested inside a run (including both the mc:Choice and the
+    mc:Fallback copy of their content) are skipped.
+    """
+    parts = []
+    for child in paragraph:
+        tag = child.tag
+        if tag == W_R:
+            parts.append(_run_text(child))
+        elif tag == W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == W_R)
+    return "".join(parts)
+
+
+def _main_document_part(archive: zipfile.ZipFile) -> str:
+    """
+    Return the name of the main document part of an open .docx archive.
+
+    Like python-docx, the part is found through the officeDocument relationship
+    in _rels/.rels, since some producers name it other than word/document.xml.
+    """
+    try:
+        relationships = etree.fromstring(archive.read(PACKAGE_RELATIONSHIPS))
+    except KeyError:
+        return DEFAULT_MAIN_PART
+
+    for relationship in relationships.iter(RELATIONSHIP):
+        if relationship.get("Type", "").endswith(OFFICE_DOCUMENT_TYPE_SUFFIX):
+            # Targets are relative to the package root; drop a leading "/" or "./"
+            return posixpath.normpath(relationship.get("Target")).lstrip("/")
+    return DEFAULT_MAIN_PART
+
+
+def iter_paragraph_texts(docx_path) -> Iterator[str]:
+    """
+    Stream the stripped text of every body paragraph in a .docx file.
+
+    Like python-docx's ``Document.paragraphs``, only paragraphs that are direct
+    children of the document body are included (not those nested in tables or
+    text boxes), and tabs and line breaks in a run become "\\t" and "\\n".
+    The main document part is parsed incrementally with lxml, and each paragraph
+    element is freed once its text has been yielded, so memory stays bounded by
+    the size of a single paragraph instead of the whole document.
+    """
+    with zipfile.ZipFile(docx_path) as archive:
+        with archive.open(_main_document_part(archive)) as document_xml:
+            for _, paragraph in etree.iterparse(document_xml, events=("end",), tag=W_P):
+                if paragraph.getparent().tag != W_BODY:
+                    continue
+
+                # Read the run texts directly instead of going through
+                # python-docx's Paragraph/Run wrappers
+                yield _paragraph_text(paragraph).strip()
+
+                # Drop the processed paragraph and any preceding siblings
+                paragraph.clear()
+                while paragraph.getprevious() is not None:
+                    del paragraph.getparent()[0]
@@ -1,58 +1,77 @@
-from bs4 import BeautifulSoup
+from pathlib import Path
 
+from bs4 import BeautifulSoup, SoupStrainer
 
-# Function to convert an integer to Tibetan-style numbering
-def get_tibetan_number(index):
-    tibetan_digits = ["༠", "༡", "༢", "༣", "༤", "༥", "༦", "༧", "༨", "༩"]
-    tibetan_number = ""
+from TibQA._io_utils import BUFFER_SIZE
+from TibQA.tibetan_processor import tibetan_number as get_tibetan_number
 
-    # Convert the index into a Tibetan-style number
-    for digit in str(index):
-        tibetan_number += tibetan_digits[int(digit)]
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[misc,assignment]
 
-    return tibetan_number + "༽"
 
+def iter_span_texts(file_path):
+    """
+    Yield the stripped text of the first <span class="span0"> of every <p>.
 
-def parse_html(file_path):
-    # Open the HTML file and read its contents
-    with open(file_path, encoding="utf-8") as file:
-        soup = BeautifulSoup(file, "html.parser")
+    Only one span is taken per paragraph, since Word-exported HTML can split a
+    paragraph's text across several span0 runs; span0 spans outside a <p> are
+    ignored.
+    """
+    if LexborHTMLParser is not None:
+        # selectolax matches the elements in C without building Python objects per tag
+        tree = LexborHTMLParser(Path(file_path).read_bytes())
+        for node in tree.css("p"):
+            span_node = node.css_first("span.span0")
+            if span_node is not None:
+                yield span_node.text().strip()
+        return
+
+    # Only build tree nodes for the paragraphs that hold the spans
+    strainer = SoupStrainer("p")
+
+    # Open the HTML file in binary mode so BeautifulSoup skips encoding detection
+    with open(file_path, "rb", buffering=BUFFER_SIZE) as file:
+        soup = BeautifulSoup(file, "lxml", parse_only=strainer, from_encoding="utf-8")
+
+    for paragraph in soup.find_all("p"):
+        span = paragraph.find("span", class_="span0")
+        if span:
+            yield span.get_text().strip()
 
+
+def parse_html(file_path):
     questions = []
     answers = []
 
     question_index = 1
     answer_index = 1
 
-    # Find all paragraphs containing spans with class 'span0'
-    paragraphs = soup.find_all("p")
-
-    for paragraph in paragraphs:
-        span = paragraph.find("span", class_="span0")
-        if span:
-            content = span.get_text().strip()
-
-            # Check if the paragraph contains 'ལན།', marking it as an answer
-            if "ལན།" in content:
-                # Remove 'ལན།' from the answer and apply Tibetan indexing
-                answer = content.replace("ལན།", "").strip()
-                indexed_answer = f"{get_tibetan_number(answer_index)} {answer}"
-                answers.append(indexed_answer)
-                answer_index += 1
-            else:
-                # If it's a question, extract the content after the first space and add Tibetan indexing
-                question = content.split(" ", 1)[-1] if " " in content else content
-                indexed_question = f"{get_tibetan_number(question_index)} {question}"
-                questions.append(indexed_question)
-                question_index += 1
+    for content in iter_span_texts(file_path):
+        # Check if the paragraph contains 'ལན།', marking it as an answer,
+        # and split around it in the same scan
+        head, marker, tail = content.partition("ལན།")
+        if marker:
+            # Remove 'ལན།' from the answer and apply Tibetan indexing
+            answer = (head + tail).strip()
+            indexed_answer = f"{get_tibetan_number(answer_index)} {answer}"
+            answers.append(indexed_answer)
+            answer_index += 1
+        else:
+            # If it's a question, extract the content after the first space and add Tibetan indexing
+            question = content.split(" ", 1)[-1] if " " in content else content
+            indexed_question = f"{get_tibetan_number(question_index)} {question}"
+            questions.append(indexed_question)
+            question_index += 1
 
     return questions, answers
 
 
 def save_to_file(filename, data):
-    with open(filename, "w", encoding="utf-8") as file:
-        for item in data:
-            file.write(item + "\n")
+    # Encode each line and hand them to the buffered binary writer in one call
+    with open(filename, "wb", buffering=BUFFER_SIZE) as file:
+        file.writelines(f"{item}\n".encode("utf-8") for item in data)
 
 
 if __name__ == "__main__":
@@ -1,14 +1,19 @@
+from pathlib import Path
+
+import orjson
 import pandas as pd
 from datasets import Dataset, DatasetDict
 
+from TibQA._io_utils import BUFFER_SIZE
+
 
 def get_data_df_json(json_file):
     """
     This function reads a JSON file and converts it into a pandas DataFrame.
     The JSON file is expected to contain 'source', 'target', and 'filename' fields.
     """
-    # Load JSON data into pandas DataFrame
-    df = pd.read_json(json_file)
+    # Load JSON data with orjson and build the pandas DataFrame from the records
+    df = pd.DataFrame(orjson.loads(Path(json_file).read_bytes()))
 
     # Check if the DataFrame is loaded correctly
     print(df.head())  # Optional: Just to verify if the data is loaded correctly
@@ -21,11 +26,11 @@ def get_data_df_txt(txt_file):
     Reads a text file with one word per line and converts it into a pandas DataFrame.
     """
     # Read the text file
-    with open(txt_file, encoding="utf-8") as f:
+    with open(txt_file, encoding="utf-8", buffering=BUFFER_SIZE) as f:
         words = f.read().splitlines()
 
-    # Convert to DataFrame
-    df = pd.DataFrame({"word": words})
+    # Convert to DataFrame with an Arrow-backed string column instead of object dtype
+    df = pd.DataFrame({"word": pd.array(words, dtype="string[pyarrow]")})
 
     return df
 
@@ -35,8 +40,25 @@ def push_df_to_hub(train_df):
     This function directly pushes a pandas DataFrame to the Hugging Face Hub.
     """
     # Convert the pandas DataFrame to Hugging Face Dataset
-    train_dataset = Dataset.from_pandas(train_df)
+    push_dataset_to_hub(Dataset.from_pandas(train_df))
+
 
+def push_json_to_hub(json_file):
+    """
+    Reads the combined Q&A JSON file and pushes it to the Hugging Face Hub without pandas.
+    The columns are built as plain Python lists so Arrow infers string types directly.
+    """
+    rows = orjson.loads(Path(json_file).read_bytes())
+    columns = {
+        key: [row[key] for row in rows] for key in ("question", "answer", "filename")
+    }
+    push_dataset_to_hub(Dataset.from_dict(columns))
+
+
+def push_dataset_to_hub(train_dataset):
+    """
+    This function pushes a Hugging Face Dataset to the Hub as the train split.
+    """
     # Create a DatasetDict for Hugging Face
     dataset_dict = DatasetDict(
         {
@@ -50,5 +72,4 @@ def push_df_to_hub(train_df):
 
 # Usage example
 json_file = "data/output/combined_qa.json"
-df = get_data_df_json(json_file)
-push_df_to_hub(df)
+push_json_to_hub(json_file)
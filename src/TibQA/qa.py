@@ -1,84 +1,108 @@
 import re
+from functools import partial
+from itertools import chain
 from pathlib import Path
 
-import docx
+from TibQA._io_utils import BUFFER_SIZE
+from TibQA.batch import process_files
+from TibQA.docx_parser import iter_paragraph_texts
+from TibQA.tibetan_processor import tibetan_number as convert_to_tibetan_number
 
-
-def convert_to_tibetan_number(n):
-    """Convert Arabic numerals to Tibetan numerals"""
-    tibetan_digits = ["༠", "༡", "༢", "༣", "༤", "༥", "༦", "༧", "༨", "༩"]
-    return "".join(tibetan_digits[int(d)] for d in str(n)) + "༽"
+# Marker that starts every question
+QUESTION_MARKER = "དྲི་བ།"
+# Pattern to match the full Q&A pairs but ignore existing numbering
+QA_PATTERN = re.compile(r"དྲི་བ།\s*(.*?)\s*ལན།\s*(.*?)(?=དྲི་བ།|$)", re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 def clean_tibetan_text(text):
     """Clean Tibetan text by removing extra spaces while preserving punctuation"""
-    text = re.sub(r"\s+", " ", text.strip())
+    text = WHITESPACE_PATTERN.sub(" ", text.strip())
     return text
 
 
-def extract_qa_from_docx(docx_path, questions_output, answers_output):
+def iter_qa_matches(paragraphs):
     """
-    Extract questions and answers from a Tibetan docx file, re-index them, and save to separate text files.
+    Yield the QA_PATTERN matches over the non-empty paragraphs joined with newlines.
+
+    The paragraphs must be stripped, as iter_paragraph_texts yields them, so that the
+    pending text never ends with a newline that "$" could match before.
+
+    Only the text from the last unfinished Q&A pair onwards is kept in memory: a match
+    is final once another question marker follows it, so the pattern is re-run only
+    when a paragraph brings in a new marker.
     """
-    try:
-        # Read the docx file
-        doc = docx.Document(docx_path)
+    pending = []
+    for paragraph in paragraphs:
+        if not paragraph:
+            continue
+        pending.append(paragraph)
 
-        # Combine all paragraphs into one text
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        full_text = "\n".join(paragraphs)
+        if QUESTION_MARKER in paragraph:
+            text = "\n".join(pending)
+            consumed = 0
+            for match in QA_PATTERN.finditer(text):
+                # A match running to the end of the text may still grow
+                if match.end() == len(text):
+                    break
+                yield match
+                consumed = match.end()
 
-        # Debug: Print first part of the text
-        print("\nDebug: First 200 characters of text:")
-        print(full_text[:200])
+            # Keep the text from the next question marker onwards
+            start = text.find(QUESTION_MARKER, consumed)
+            pending = [text[start:]] if start != -1 else []
 
-        # Pattern to match the full Q&A pairs but ignore existing numbering
-        qa_pattern = r"དྲི་བ།\s*(.*?)\s*ལན།\s*(.*?)(?=དྲི་བ།|$)"
+    yield from QA_PATTERN.finditer("\n".join(pending))
 
-        # Find all Q&A pairs
-        qa_pairs = re.findall(qa_pattern, full_text, re.DOTALL)
-        print(f"\nDebug: Found {len(qa_pairs)} Q&A pairs")
+
+def extract_qa_from_docx(docx_path, questions_output, answers_output):
+    """
+    Extract questions and answers from a Tibetan docx file, re-index them, and save to separate text files.
+    """
+    try:
+        # Stream the Q&A pairs from the paragraphs of the docx file. The first
+        # paragraph is read before the output files are opened, so a missing or
+        # corrupt input fails here and leaves any previous output untouched
+        paragraphs = iter_paragraph_texts(docx_path)
+        first_paragraph = next(paragraphs, "")
+        qa_matches = iter_qa_matches(chain((first_paragraph,), paragraphs))
 
         # Create output directory if it doesn't exist
         output_dir = Path(questions_output).parent
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Prepare questions and answers lists with re-indexed Tibetan numerals
-        questions = []
-        answers = []
-
-        for i, (question, answer) in enumerate(qa_pairs, 1):
-            # Convert the index to a Tibetan numeral
-            tibetan_index = convert_to_tibetan_number(i)
-
-            # Clean the question and answer text
-            cleaned_question = clean_tibetan_text(question)
-            cleaned_answer = clean_tibetan_text(answer)
-
-            question_entry = f"{tibetan_index} {cleaned_question}\n\n"
-            answer_entry = f"{tibetan_index} {cleaned_answer}\n\n"
-
-            questions.append(question_entry)
-            answers.append(answer_entry)
-
-        # Write questions to file
-        with open(questions_output, "w", encoding="utf-8") as f:
-            f.writelines(questions)
-
-        # Write answers to file
-        with open(answers_output, "w", encoding="utf-8") as f:
-            f.writelines(answers)
-
-        print(f"\nSuccessfully processed {len(qa_pairs)} question-answer pairs.")
+        # Write each Q&A pair with a re-indexed Tibetan numeral as soon as it is found
+        pairs_count = 0
+        first_pair = None
+        with open(
+            questions_output, "w", encoding="utf-8", buffering=BUFFER_SIZE
+        ) as qf, open(
+            answers_output, "w", encoding="utf-8", buffering=BUFFER_SIZE
+        ) as af:
+            for pairs_count, match in enumerate(qa_matches, 1):
+                # Convert the index to a Tibetan numeral
+                tibetan_index = convert_to_tibetan_number(pairs_count)
+
+                # Clean the question and answer text
+                question_entry = f"{tibetan_index} {clean_tibetan_text(match.group(1))}"
+                answer_entry = f"{tibetan_index} {clean_tibetan_text(match.group(2))}"
+
+                qf.write(f"{question_entry}\n\n")
+                af.write(f"{answer_entry}\n\n")
+
+                if first_pair is None:
+                    first_pair = (question_entry, answer_entry)
+
+        print(f"\nSuccessfully processed {pairs_count} question-answer pairs.")
         print(f"Questions saved to: {questions_output}")
         print(f"Answers saved to: {answers_output}")
 
-        if qa_pairs:
+        if first_pair:
             print("\nFirst Q&A pair for verification:")
-            print(f"Question: {questions[0].strip()}")
-            print(f"Answer: {answers[0].strip()}")
+            print(f"Question: {first_pair[0]}")
+            print(f"Answer: {first_pair[1]}")
 
-        return len(qa_pairs)
+        return pairs_count
 
     except Exception as e:
         print(f"Error processing document: {str(e)}")
@@ -88,15 +112,8 @@ def extract_qa_from_docx(docx_path, questions_output, answers_output):
         return 0
 
 
-def main():
-    # Get current working directory
-    current_dir = Path.cwd()
-
-    # Configure paths
-    input_file = current_dir / "data" / "input" / "དྲི་ལན་སྣ་ཚོགས།.docx"
-    output_dir = current_dir / "data" / "output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
+def process_file(input_file, output_dir):
+    """Extract the Q&A pairs of one docx file into output_dir."""
     # Create output filenames
     base_name = input_file.stem
     questions_file = output_dir / f"{base_name}_questions.txt"
@@ -117,12 +134,27 @@ def main():
             print(
                 "\nNo question-answer pairs were extracted. Please check the input file format."
             )
+        return pairs_count
 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
         import traceback
 
         traceback.print_exc()
+        return 0
+
+
+def main():
+    # Get current working directory
+    current_dir = Path.cwd()
+
+    # Configure paths
+    input_files = [current_dir / "data" / "input" / "དྲི་ལན་སྣ་ཚོགས།.docx"]
+    output_dir = current_dir / "data" / "output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Spread the documents across worker processes (a single one runs inline)
+    process_files(partial(process_file, output_dir=output_dir), input_files)
 
 
 if __name__ == "__main__":
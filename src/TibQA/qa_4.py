@@ -1,23 +1,22 @@
 import logging
-import os
-import re
+from functools import partial
+from pathlib import Path
 from typing import List, Tuple
 
-from docx import Document
+from TibQA._io_utils import write_joined
+from TibQA.batch import process_files
+from TibQA.docx_parser import iter_paragraph_texts
 
 
 class TibetanTextProcessor:
     """Process Tibetan text documents with questions and answers."""
 
+    # Questions start with this character
+    _QUESTION_START = "༈"
+    # Answers start with one of these prefixes
+    _ANS_PREFIXES = ("དེའི་ལན་ནི།", "དེའི་དོན་ནི།")
+
     def __init__(self, debug=True):
-        # Regular expressions to match the start of a question and answer
-        self.question_start_pattern = re.compile(r"^༈")  # Questions start with "༈"
-        self.answer_start_pattern = re.compile(
-            r"^(དེའི་ལན་ནི།|དེའི་དོན་ནི།)"
-        )  # Answers start with these patterns
-        self.answer_remove_pattern = re.compile(
-            r"^(དེའི་ལན་ནི།|དེའི་དོན་ནི།)"
-        )  # For removing unwanted phrases in the answers
         self.shey_character = (
             "།"  # The "shey" character, used as a delimiter in Tibetan
         )
@@ -38,23 +37,13 @@ class TibetanTextProcessor:
     def clean_question_text(self, text: str) -> str:
         """Clean the question text by removing everything before the first shey character."""
         # Remove everything before the first "།" (shey) character
-        if self.shey_character in text:
-            return text.split(self.shey_character, 1)[1].strip()
-        return text.strip()
-
-    def clean_answer_text(self, text: str) -> str:
-        """Clean the answer text by removing unwanted prefixes."""
-        # Remove the unwanted answer prefixes such as "དེའི་ལན་ནི།" or "དེའི་དོན་ནི།"
-        return self.answer_remove_pattern.sub("", text).strip()
+        # The paragraph text is already stripped; only the part after the shey needs it
+        _, sep, tail = text.partition(self.shey_character)
+        return tail.strip() if sep else text
 
     def parse_docx(self, file_path: str) -> Tuple[List[str], List[str]]:
         """Parse questions and answers from a .docx file."""
-        try:
-            self.logger.info(f"Starting to parse document: {file_path}")
-            document = Document(file_path)
-        except Exception as e:
-            self.logger.error(f"Failed to open document {file_path}: {e}")
-            raise
+        self.logger.info(f"Starting to parse document: {file_path}")
 
         parsed_questions: List[str] = []
         parsed_answers: List[str] = []
@@ -62,16 +51,27 @@ class TibetanTextProcessor:
         current_answer: List[str] = []
         question_counter = 1
 
-        for paragraph in document.paragraphs:
-            line = paragraph.text.strip()
+        # Bind the per-line lookups once instead of resolving them for every paragraph
+        question_start = self._QUESTION_START
+        answer_prefixes = self._ANS_PREFIXES
+        clean_question_text = self.clean_question_text
+        process_current_qa = self._process_current_qa
+        # The bound append is rebound whenever current_answer is replaced
+        add_answer = current_answer.append
+        # Debug messages are only built when debug logging is enabled
+        debug = self.logger.debug
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        for line in iter_paragraph_texts(file_path):
             if not line:
                 continue
 
             # Check if the line starts with a question (starting with "༈")
-            if self.question_start_pattern.match(line):
-                self.logger.debug(f"Found question: {line}")
+            if line.startswith(question_start):
+                if debug_enabled:
+                    debug("Found question: %s", line)
                 if current_question:
-                    self._process_current_qa(
+                    process_current_qa(
                         current_question,
                         current_answer,
                         question_counter,
@@ -80,15 +80,21 @@ class TibetanTextProcessor:
                     )
                     question_counter += 1
                 # Clean the question by removing everything before the first "།"
-                current_question = self.clean_question_text(line)
+                current_question = clean_question_text(line)
                 current_answer = []
-            # Check if the line starts with an answer (starting with "དེའི་ལན་ནི།" or "དེའི་དོན་ནི།")
-            elif self.answer_start_pattern.match(line):
-                current_answer.append(self.clean_answer_text(line))  # Clean answer text
+                add_answer = current_answer.append
             else:
-                # Continue building the answer
-                current_answer.append(line)
-                self.logger.debug(f"Added to current answer: {line}")
+                # Check if the line starts with an answer (starting with "དེའི་ལན་ནི།" or "དེའི་དོན་ནི།")
+                # and remove the matched answer prefix by slicing it off
+                for prefix in answer_prefixes:
+                    if line.startswith(prefix):
+                        add_answer(line[len(prefix) :].strip())  # noqa
+                        break
+                else:
+                    # Continue building the answer
+                    add_answer(line)
+                    if debug_enabled:
+                        debug("Added to current answer: %s", line)
 
         # Process the last question-answer pair
         if current_question:
@@ -131,21 +137,19 @@ class TibetanTextProcessor:
         output_dir: str,
     ) -> None:
         """Save processed questions and answers to files."""
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_path = os.path.join(output_dir)
-        os.makedirs(output_path, exist_ok=True)
+        base_name = Path(input_file).stem
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
 
-        questions_path = os.path.join(output_path, f"{base_name}_questions.txt")
-        answers_path = os.path.join(output_path, f"{base_name}_answers.txt")
+        questions_path = output_path / f"{base_name}_questions.txt"
+        answers_path = output_path / f"{base_name}_answers.txt"
 
         try:
             # Save questions with double newlines for better formatting
-            with open(questions_path, "w", encoding="utf-8") as qf:
-                qf.write("\n\n".join(questions))
+            write_joined(questions_path, questions, "\n\n")
 
             # Save answers with double newlines for better formatting
-            with open(answers_path, "w", encoding="utf-8") as af:
-                af.write("\n\n".join(answers))
+            write_joined(answers_path, answers, "\n\n")
 
             self.logger.info(
                 f"Successfully saved output files:\n"  # noqa
@@ -158,20 +162,26 @@ class TibetanTextProcessor:
             raise
 
 
+def process_file(input_file, output_dir: str) -> None:
+    """Parse one .docx file and save its questions and answers to output_dir."""
+    # Debug logging is off so worker processes do not flood the shared stderr
+    processor = TibetanTextProcessor(debug=False)
+
+    # Parse document
+    questions, answers = processor.parse_docx(input_file)
+
+    # Save results
+    processor.save_output(input_file, questions, answers, output_dir)
+
+
 def main():
     # Input and output paths
-    input_file = "data/input/གཞན་སྟོང་བགྲོ་གླེང་ཐེངས་དང་པོའི་དྲི་བ་དྲིས་ལན། 10.docx"
+    input_files = ["data/input/གཞན་སྟོང་བགྲོ་གླེང་ཐེངས་དང་པོའི་དྲི་བ་དྲིས་ལན། 10.docx"]
     output_dir = "data/output"
 
-    # Initialize processor with debug mode
-    processor = TibetanTextProcessor(debug=True)
-
     try:
-        # Parse document
-        questions, answers = processor.parse_docx(input_file)
-
-        # Save results
-        processor.save_output(input_file, questions, answers, output_dir)
+        # Spread the documents across worker processes (a single one runs inline)
+        process_files(partial(process_file, output_dir=output_dir), input_files)
 
     except Exception as e:
         logging.error(f"Processing failed: {e}")
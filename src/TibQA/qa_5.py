@@ -1,9 +1,15 @@
 import logging
 import re
+from functools import partial
 from pathlib import Path
 from typing import List, Tuple
 
-from docx import Document
+from TibQA._io_utils import write_joined
+from TibQA.batch import process_files
+from TibQA.docx_parser import iter_paragraph_texts
+
+# Pattern to strip a leading Tibetan alphabet marker from a question
+ALPHABET_STRIP_PATTERN = re.compile(r"^[ཀ-ཨ]\s*")
 
 
 class TibetanTextProcessor:
@@ -26,12 +32,7 @@ class TibetanTextProcessor:
 
     def parse_docx(self, file_path: Path) -> Tuple[List[str], List[str]]:
         """Parse questions and answers from a .docx file."""
-        try:
-            self.logger.info(f"Starting to parse document: {file_path}")
-            document = Document(file_path)
-        except Exception as e:
-            self.logger.error(f"Failed to open document {file_path}: {e}")
-            raise
+        self.logger.info(f"Starting to parse document: {file_path}")
 
         parsed_questions: List[str] = []
         parsed_answers: List[str] = []
@@ -39,16 +40,22 @@ class TibetanTextProcessor:
         current_answer: List[str] = []
         question_counter = 1
 
-        for paragraph in document.paragraphs:
-            line = paragraph.text.strip()
+        # Bind the per-line lookups once instead of resolving them for every paragraph
+        alphabet_match = self.alphabet_pattern.match
+        process_current_qa = self._process_current_qa
+        # The bound appends are rebound whenever the lists are replaced
+        add_question = current_question.append
+        add_answer = current_answer.append
+
+        for line in iter_paragraph_texts(file_path):
             if not line:
                 continue
 
-            if self.alphabet_pattern.match(
+            if alphabet_match(
                 line
             ):  # If the line is a Tibetan alphabet marker, it's a new question
                 if current_question or current_answer:
-                    self._process_current_qa(
+                    process_current_qa(
                         current_question,
                         current_answer,
                         question_counter,
@@ -58,15 +65,17 @@ class TibetanTextProcessor:
                     question_counter += 1
                     current_question = []
                     current_answer = []
-                current_question.append(line)  # This is part of the question
+                    add_question = current_question.append
+                    add_answer = current_answer.append
+                add_question(line)  # This is part of the question
 
             elif (
                 current_question
             ):  # Collect the text after the Tibetan alphabet marker as part of the question
                 if len(current_question) == 1:
-                    current_question.append(line)
+                    add_question(line)
                 else:
-                    current_answer.append(line)
+                    add_answer(line)
 
         # Ensure the last question-answer pair is processed
         if current_question or current_answer:
@@ -90,18 +99,16 @@ class TibetanTextProcessor:
         answers_list: List[str],
     ) -> None:
         """Process a single question-answer pair."""
-        # Remove Tibetan alphabet marker from the question
-        cleaned_question = " ".join(question).strip()
-        cleaned_question = re.sub(
-            r"^[ཀ-ཨ]\s*", "", cleaned_question
-        ).strip()  # Remove the Tibetan alphabet marker
+        # Remove Tibetan alphabet marker and the whitespace after it from the question;
+        # the lines are already stripped, so the result needs no further strip
+        cleaned_question = ALPHABET_STRIP_PATTERN.sub("", " ".join(question))
 
         # Add new question number without Tibetan alphabet marker
         numbered_question = f"{counter}༽ {cleaned_question}"
         questions_list.append(numbered_question)
 
-        # Clean answer and join into one string
-        numbered_answer = f"{counter}༽ " + " ".join(answer).strip()
+        # Join the answer lines into one string; they are already stripped and non-empty
+        numbered_answer = f"{counter}༽ " + " ".join(answer)
         answers_list.append(numbered_answer)
 
     def save_output(
@@ -121,12 +128,10 @@ class TibetanTextProcessor:
 
         try:
             # Save questions
-            with open(questions_path, "w", encoding="utf-8") as qf:
-                qf.write("\n\n".join(questions))
+            write_joined(questions_path, questions, "\n\n")
 
             # Save answers
-            with open(answers_path, "w", encoding="utf-8") as af:
-                af.write("\n\n".join(answers))
+            write_joined(answers_path, answers, "\n\n")
 
             self.logger.info(
                 f"Successfully saved output files:\nQuestions: {questions_path}\nAnswers: {answers_path}"  # noqa
@@ -138,17 +143,24 @@ class TibetanTextProcessor:
             raise
 
 
+def process_file(input_file: Path, output_dir: str) -> Tuple[Path, Path]:
+    """Parse one .docx file and save its questions and answers to output_dir."""
+    # Debug logging is off so worker processes do not flood the shared stderr
+    processor = TibetanTextProcessor(debug=False)
+
+    questions, answers = processor.parse_docx(input_file)
+    return processor.save_output(input_file, questions, answers, output_dir)
+
+
 def main():
-    input_file = Path(
-        "data/input/ཐོན་མིའི་ཞལ་ལུང་གི་ཨེ་ཁྱབ་སུམ་ཅུའི་དྲི་བ་དྲིས་ལན། 11 (1).docx"
-    )
+    input_files = [
+        Path("data/input/ཐོན་མིའི་ཞལ་ལུང་གི་ཨེ་ཁྱབ་སུམ་ཅུའི་དྲི་བ་དྲིས་ལན། 11 (1).docx")
+    ]
     output_dir = "data/output"
 
-    processor = TibetanTextProcessor(debug=True)
-
     try:
-        questions, answers = processor.parse_docx(input_file)
-        processor.save_output(input_file, questions, answers, output_dir)
+        # Spread the documents across worker processes (a single one runs inline)
+        process_files(partial(process_file, output_dir=output_dir), input_files)
     except Exception as e:
         logging.error(f"Processing failed: {e}")
         raise
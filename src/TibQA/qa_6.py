@@ -1,67 +1,66 @@
 import re
+from functools import partial
 from pathlib import Path
 from typing import List
 
-from docx import Document
+from TibQA._io_utils import write_joined
+from TibQA.batch import process_files
+from TibQA.docx_parser import iter_paragraph_texts
+from TibQA.tibetan_processor import int_to_tibetan_numeral, tibetan_prefix
 
+# Question marker: a Tibetan number inside '༼' and '༽'
+QUESTION_MARKER_PATTERN = re.compile(r"༼\s*[༠-༩]+\s*༽")
 
-class TibetanDocProcessor:
-    TIBETAN_NUMBERS = "༠༡༢༣༤༥༦༧༨༩"
-
-    def __init__(self):
-        self.question_pattern = re.compile(
-            r"༼\s*([༠-༩]+)\s*༽"
-        )  # Capture Tibetan number inside '༼' and '༽'
-        self.tseg_pattern = re.compile(r"་$")  # Check if the line ends with a tseg
 
+class TibetanDocProcessor:
     def process_docx(
         self, input_file: Path, output_question_file: Path, output_answer_file: Path
     ):
-        document = Document(input_file)
-        questions = []
-        answers = []
+        questions: List[str] = []
+        answers: List[str] = []
         current_question = ""
         current_answer: List[str] = []
         question_counter = 1
+        # Numbered prefix shared by the current question and its answer
+        prefix = ""
 
-        for para in document.paragraphs:
-            line = para.text.strip()
+        # Bind the per-line lookups once instead of resolving them for every paragraph
+        remove_question_marker = QUESTION_MARKER_PATTERN.subn
+        add_question = questions.append
+        add_answer = answers.append
+        # Rebound whenever current_answer is replaced
+        add_answer_line = current_answer.append
 
+        for line in iter_paragraph_texts(input_file):
             if not line:
                 continue  # Skip empty lines
 
-            match = self.question_pattern.search(line)
-            if match:
+            # Find and remove the ༼ ༡ ༽ part in one pass
+            question_text, found = remove_question_marker("", line, count=1)
+            if found:
                 # If we find a new question marker and there is a current question, save it
                 if current_question:
-                    questions.append(f"{current_question.strip()}")
-                    answers.append(
-                        f"{self.int_to_tibetan(question_counter)}༽ "
-                        + "\n".join(current_answer).strip()
-                    )
+                    add_question(current_question.strip())
+                    add_answer(prefix + "\n".join(current_answer))
                     current_question = ""
                     current_answer = []
+                    add_answer_line = current_answer.append
                     question_counter += 1
 
-                # Start a new question and remove the ༼ ༡ ༽ part
-                current_question = line.replace(match.group(0), "").strip()
-                current_question = (
-                    f"{self.int_to_tibetan(question_counter)}༽ {current_question}"
-                )
-            elif current_question and self.tseg_pattern.search(current_question):
+                # Start a new question from the line without its marker
+                prefix = tibetan_prefix(question_counter)
+                current_question = prefix + question_text.strip()
+            elif current_question and current_question.endswith("་"):
                 # If the current question ends with a tseg, continue the question
                 current_question += " " + line
             else:
                 # It's an answer if there's no tseg at the end of the question
-                current_answer.append(line)
+                add_answer_line(line)
 
         # Save the last question-answer pair
         if current_question:
-            questions.append(f"{current_question.strip()}")
-            answers.append(
-                f"{self.int_to_tibetan(question_counter)}༽ "
-                + "\n".join(current_answer).strip()
-            )
+            add_question(current_question.strip())
+            add_answer(prefix + "\n".join(current_answer))
 
         # Save questions and answers to their respective files
         self.save_to_file(output_question_file, questions)
@@ -69,25 +68,30 @@ class TibetanDocProcessor:
 
     def int_to_tibetan(self, num: int) -> str:
         """Convert integer to Tibetan numeral."""
-        tibetan_number = "".join(self.TIBETAN_NUMBERS[int(digit)] for digit in str(num))
-        return tibetan_number
+        return int_to_tibetan_numeral(num)
 
     def save_to_file(self, output_file: Path, data: list):
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n\n".join(data))
+        write_joined(output_file, data, "\n\n")
 
 
-def main():
+def process_file(input_file: Path, output_dir: Path) -> None:
+    """Parse one .docx file and save its questions and answers to output_dir."""
     processor = TibetanDocProcessor()
 
-    input_file = Path("data/input/རྩོམ་རིག་ལོ་རྒྱུས་སྐོར་གྱི་དྲི་བ་དྲིས་ལན།.docx")
     base_name = input_file.stem
-    output_dir = Path("data/output")
     output_question_file = output_dir / f"{base_name}_questions.txt"
     output_answer_file = output_dir / f"{base_name}_answers.txt"
 
     processor.process_docx(input_file, output_question_file, output_answer_file)
 
 
+def main():
+    input_files = [Path("data/input/རྩོམ་རིག་ལོ་རྒྱུས་སྐོར་གྱི་དྲི་བ་དྲིས་ལན།.docx")]
+    output_dir = Path("data/output")
+
+    # Spread the documents across worker processes (a single one runs inline)
+    process_files(partial(process_file, output_dir=output_dir), input_files)
+
+
 if __name__ == "__main__":
     main()
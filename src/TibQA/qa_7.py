@@ -1,11 +1,14 @@
 import re
+from functools import partial
 from pathlib import Path
 from typing import List
 
-from docx import Document
+from TibQA.batch import process_files
+from TibQA.docx_parser import iter_paragraph_texts
+from TibQA.tibetan_processor import int_to_tibetan_numeral, tibetan_prefix
 
-# Define a list of Tibetan numbers
-tibetan_numbers = ["༠", "༡", "༢", "༣", "༤", "༥", "༦", "༧", "༨", "༩"]
+# Questions start with an English number such as "1."
+QUESTION_NUMBER_PATTERN = re.compile(r"^\d+\.")
 
 
 class TibetanDocProcessor:
@@ -16,27 +19,33 @@ class TibetanDocProcessor:
 
     def process(self):
         """Process the DOCX file to extract questions and answers."""
-        doc = Document(self.docx_file)
         current_question: List[str] = []
         current_answer: List[str] = []
         is_question = False
         is_answer = False
 
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        # Bind the per-line lookups once instead of resolving them for every paragraph
+        question_match = QUESTION_NUMBER_PATTERN.match
+        add_question = self.questions.append
+        add_answer = self.answers.append
+        # Rebound whenever current_question or current_answer is replaced
+        add_question_part = current_question.append
+        add_answer_part = current_answer.append
 
+        for text in iter_paragraph_texts(self.docx_file):
             if not text:
                 continue
 
             # Check if it starts with an English number for the question
-            if re.match(r"^\d+\.", text):  # Matches something like "1."
+            if question_match(text):  # Matches something like "1."
                 # Append the previous question if one exists
                 if current_question:
-                    self.questions.append(" ".join(current_question).strip())
+                    add_question(" ".join(current_question).strip())
                     current_question = []
+                    add_question_part = current_question.append
 
                 # Start capturing the new question after the number
-                current_question.append(text.split(".", 1)[1].strip())
+                add_question_part(text.split(".", 1)[1].strip())
                 is_question = True
                 is_answer = False
 
@@ -44,27 +53,28 @@ class TibetanDocProcessor:
             elif text.startswith("ལན།"):
                 # If there's an existing answer, append it
                 if current_answer:
-                    self.answers.append(" ".join(current_answer).strip())
+                    add_answer(" ".join(current_answer).strip())
                     current_answer = []
+                    add_answer_part = current_answer.append
 
                 # Start capturing the answer, marking it as an answer
                 is_question = False
                 is_answer = True
-                current_answer.append(text.replace("ལན།", "").strip())
+                add_answer_part(text.replace("ལན།", "").strip())
 
             elif is_question:
                 # Continue adding to the current question
-                current_question.append(text)
+                add_question_part(text)
 
             elif is_answer:
                 # Continue adding to the current answer
-                current_answer.append(text)
+                add_answer_part(text)
 
         # Save the last question and answer
         if current_question:
-            self.questions.append(" ".join(current_question).strip())
+            add_question(" ".join(current_question).strip())
         if current_answer:
-            self.answers.append(" ".join(current_answer).strip())
+            add_answer(" ".join(current_answer).strip())
 
     def save_to_files(self, input_file, output_dir: str):
         """Save questions and answers to separate text files."""
@@ -73,35 +83,34 @@ class TibetanDocProcessor:
         questions_file = Path(output_dir) / f"{base_name}_questions.txt"
         answers_file = Path(output_dir) / f"{base_name}_answers.txt"
 
+        # Build the Tibetan numbering once for both files
+        count = max(len(self.questions), len(self.answers))
+        prefixes = [tibetan_prefix(idx) for idx in range(1, count + 1)]
+
         # Save questions with Tibetan numbering
         with open(questions_file, "w", encoding="utf-8") as qf:
-            for idx, question in enumerate(self.questions, start=1):
-                tibetan_num = self.convert_to_tibetan_number(idx)
-                qf.write(f"{tibetan_num}༽ {question}\n\n")
+            qf.writelines(
+                f"{prefix}{question}\n\n"
+                for prefix, question in zip(prefixes, self.questions)
+            )
 
         # Save answers with Tibetan numbering
         with open(answers_file, "w", encoding="utf-8") as af:
-            for idx, answer in enumerate(self.answers, start=1):
-                tibetan_num = self.convert_to_tibetan_number(idx)
-                af.write(f"{tibetan_num}༽ {answer}\n\n")
+            af.writelines(
+                f"{prefix}{answer}\n\n"
+                for prefix, answer in zip(prefixes, self.answers)
+            )
 
         print(f"Questions saved to {questions_file}")
         print(f"Answers saved to {answers_file}")
 
     def convert_to_tibetan_number(self, num):
         """Convert an integer to Tibetan numerals."""
-        tibetan_num = ""
-        for digit in str(num):
-            tibetan_num += tibetan_numbers[int(digit)]
-        return tibetan_num
+        return int_to_tibetan_numeral(num)
 
 
-def main():
-    # Path to your input DOCX file and the output directory
-    input_file = Path("data/input/གསོ་བ་རིག་པའི་སྐོར་གྱི་དྲི་བ་དྲིས་ལན་འོས་སྦྱོར།.docx")
-    output_dir = "data/output"
-
-    # Initialize and process the document
+def process_file(input_file: Path, output_dir: str) -> None:
+    """Process one DOCX file and save its questions and answers to output_dir."""
     processor = TibetanDocProcessor(input_file)
     processor.process()
 
@@ -109,5 +118,16 @@ def main():
     processor.save_to_files(input_file, output_dir)
 
 
+def main():
+    # Paths to your input DOCX files and the output directory
+    input_files = [
+        Path("data/input/གསོ་བ་རིག་པའི་སྐོར་གྱི་དྲི་བ་དྲིས་ལན་འོས་སྦྱོར།.docx")
+    ]
+    output_dir = "data/output"
+
+    # Spread the documents across worker processes (a single one runs inline)
+    process_files(partial(process_file, output_dir=output_dir), input_files)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,190 @@
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+from TibQA._io_utils import write_joined
+from TibQA.docx_parser import iter_paragraph_texts
+
+# Translation table from Arabic to Tibetan digits
+TIBETAN_DIGITS = str.maketrans("0123456789", "༠༡༢༣༤༥༦༧༨༩")
+
+# Initial Tibetan numbers, or numbers repeated after ༽ as in "༡༽ ༡", in one pass
+QUESTION_NUMBER_PATTERN = re.compile(r"^[༠-༩]+|༽\s*[༠-༩]+\s*")
+
+
+@lru_cache(maxsize=None)
+def int_to_tibetan_numeral(num: int) -> str:
+    """Convert integer to Tibetan numeral string."""
+    return str(num).translate(TIBETAN_DIGITS)
+
+
+@lru_cache(maxsize=4096)
+def tibetan_number(num: int) -> str:
+    """Return the Tibetan number marker, e.g. "༡༢༽", for num."""
+    return int_to_tibetan_numeral(num) + "༽"
+
+
+@lru_cache(maxsize=4096)
+def tibetan_prefix(num: int) -> str:
+    """Return the Tibetan numbered prefix, e.g. "༡༢༽ ", for num."""
+    return tibetan_number(num) + " "
+
+
+def _replace_question_number(match: re.Match) -> str:
+    """Drop initial numbers and collapse a repeated number after ༽ to "༽ "."""
+    return "༽ " if match.group(0).startswith("༽") else ""
+
+
+class TibetanTextProcessor:
+    """Process Tibetan text documents with questions starting with Tibetan numerals."""
+
+    # Prefix marking an answer line; it is removed from the answer text
+    answer_prefix = "ལན། "
+    # When True, the lines after a question continue it until a line starting with
+    # answer_prefix opens the answer; otherwise every following line is answer text
+    answer_marker_required = False
+
+    int_to_tibetan_numeral = staticmethod(int_to_tibetan_numeral)
+
+    def __init__(self, debug=True):
+        self.debug = debug
+
+        # Setup logging
+        self._setup_logging()
+
+    def _setup_logging(self):
+        """Configure logging for the processor."""
+        logging.basicConfig(
+            level=logging.DEBUG if self.debug else logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def clean_question_text(text: str) -> str:
+        """Clean the question text by removing unwanted numbers."""
+        return QUESTION_NUMBER_PATTERN.sub(_replace_question_number, text).strip()
+
+    def parse_docx(self, file_path: Path) -> Tuple[List[str], List[str]]:
+        """Parse questions and answers from a .docx file."""
+        self.logger.info(f"Starting to parse document: {file_path}")
+
+        parsed_questions: List[str] = []
+        parsed_answers: List[str] = []
+        current_question: List[str] = []
+        current_answer: List[str] = []
+        question_counter = 1
+
+        # Bind the per-line lookups once; debug messages are only built when enabled
+        process_current_qa = self._process_current_qa
+        answer_prefix = self.answer_prefix
+        marker_required = self.answer_marker_required
+        debug = self.logger.debug
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Without answer markers, any text before the first question is answer text
+        # that gets discarded along with the empty question
+        is_answer = not marker_required
+
+        for line in iter_paragraph_texts(file_path):
+            if not line:
+                continue
+
+            # Check if the line starts with a Tibetan numeral; the digits ༠-༩ are
+            # the contiguous code points U+0F20-U+0F29, so one comparison suffices
+            if "༠" <= line[0] <= "༩":
+                if debug_enabled:
+                    debug("Found question: %s", line)
+                if current_question and (current_answer or not marker_required):
+                    process_current_qa(
+                        " ".join(current_question),
+                        current_answer,
+                        question_counter,
+                        parsed_questions,
+                        parsed_answers,
+                    )
+                    question_counter += 1
+                current_question = [line]
+                current_answer = []
+                is_answer = not marker_required
+            elif line.startswith(answer_prefix):
+                # Remove the answer marker from the line
+                is_answer = True
+                current_answer.append(line[len(answer_prefix) :].strip())  # noqa
+            elif is_answer:
+                current_answer.append(line)
+                if debug_enabled:
+                    debug("Added to current answer: %s", line)
+            else:
+                # Append to current question if it's not part of an answer
+                current_question.append(line)
+
+        # Process the last question-answer pair
+        if current_question and (current_answer or not marker_required):
+            process_current_qa(
+                " ".join(current_question),
+                current_answer,
+                question_counter,
+                parsed_questions,
+                parsed_answers,
+            )
+
+        self.logger.info(f"Parsed {len(parsed_questions)} question-answer pairs")
+        return parsed_questions, parsed_answers
+
+    def _process_current_qa(
+        self,
+        question: str,
+        answer_lines: List[str],
+        counter: int,
+        questions_list: List[str],
+        answers_list: List[str],
+    ) -> None:
+        """Process a single question-answer pair."""
+        prefix = tibetan_prefix(counter)
+
+        # Clean question text by removing unwanted numbers
+        cleaned_question = self.clean_question_text(question)
+
+        # Add new question number in the desired format
+        questions_list.append(prefix + cleaned_question)
+
+        # Add new answer number
+        answers_list.append(prefix + "\n".join(answer_lines))
+
+    def save_output(
+        self,
+        input_file: Path,
+        questions: List[str],
+        answers: List[str],
+        output_dir: str,
+    ) -> Tuple[Path, Path]:
+        """Save processed questions and answers to files."""
+        base_name = input_file.stem
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        questions_path = output_path / f"{base_name}_questions.txt"
+        answers_path = output_path / f"{base_name}_answers.txt"
+
+        try:
+            # Save questions with double newlines for better formatting
+            write_joined(questions_path, questions, "\n\n")
+
+            # Save answers with double newlines for better formatting
+            write_joined(answers_path, answers, "\n\n")
+
+            self.logger.info(
+                f"Successfully saved output files:\n"  # noqa
+                f"Questions: {questions_path}\n"
+                f"Answers: {answers_path}"
+            )
+
+            return questions_path, answers_path
+
+        except Exception as e:
+            self.logger.error(f"Failed to save output files: {e}")
+            raise
@@ -0,0 +1,38 @@
+import zipfile
+
+import pytest
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+WPS_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+V_NAMESPACE = "urn:schemas-microsoft-com:vml"
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+
+
+@pytest.fixture
+def write_docx(tmp_path):
+    """Return a function writing a minimal .docx whose body holds the given XML."""
+
+    def write(name, body, main_part="word/document.xml"):
+        document = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:document xmlns:w="{W_NAMESPACE}" xmlns:mc="{MC_NAMESPACE}" '
+            f'xmlns:wps="{WPS_NAMESPACE}" xmlns:v="{V_NAMESPACE}">'
+            f"<w:body>{body}</w:body></w:document>"
+        )
+        relationships = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<Relationships xmlns="{RELATIONSHIPS_NAMESPACE}">'
+            f'<Relationship Id="rId1" Type="{OFFICE_DOCUMENT_TYPE}" Target="{main_part}"/>'
+            "</Relationships>"
+        )
+        path = tmp_path / name
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("_rels/.rels", relationships)
+            archive.writestr(main_part, document)
+        return path
+
+    return write
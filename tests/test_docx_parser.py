@@ -0,0 +1,56 @@
+from TibQA.docx_parser import iter_paragraph_texts
+
+
+def test_line_breaks_and_tabs(write_docx):
+    docx_path = write_docx(
+        "breaks.docx",
+        "<w:p><w:r><w:t>ལན། line one</w:t><w:br/><w:t>line two</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>༡</w:t><w:tab/><w:t>question</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>one</w:t><w:cr/><w:t>two</w:t></w:r></w:p>"
+        '<w:p><w:r><w:t>page</w:t><w:br w:type="page"/><w:t>break</w:t></w:r></w:p>',
+    )
+
+    assert list(iter_paragraph_texts(docx_path)) == [
+        "ལན། line one\nline two",
+        "༡\tquestion",
+        "one\ntwo",
+        "pagebreak",
+    ]
+
+
+def test_text_box_content_is_skipped(write_docx):
+    text_box = "<w:txbxContent><w:p><w:r><w:t>BOX</w:t></w:r></w:p></w:txbxContent>"
+    docx_path = write_docx(
+        "text_box.docx",
+        "<w:p>"
+        "<w:r><w:t>plain text</w:t></w:r>"
+        "<w:r><mc:AlternateContent>"
+        f'<mc:Choice Requires="wps"><wps:txbx>{text_box}</wps:txbx></mc:Choice>'
+        f"<mc:Fallback><v:textbox>{text_box}</v:textbox></mc:Fallback>"
+        "</mc:AlternateContent></w:r>"
+        "</w:p>",
+    )
+
+    assert list(iter_paragraph_texts(docx_path)) == ["plain text"]
+
+
+def test_hyperlink_runs_and_table_paragraphs(write_docx):
+    docx_path = write_docx(
+        "hyperlink.docx",
+        '<w:p><w:r><w:t xml:space="preserve">see </w:t></w:r>'
+        "<w:hyperlink><w:r><w:t>link</w:t></w:r></w:hyperlink></w:p>"
+        "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        "<w:p><w:r><w:t>  after  </w:t></w:r></w:p>",
+    )
+
+    assert list(iter_paragraph_texts(docx_path)) == ["see link", "after"]
+
+
+def test_main_part_is_found_through_package_relationships(write_docx):
+    docx_path = write_docx(
+        "renamed.docx",
+        "<w:p><w:r><w:t>hello</w:t></w:r></w:p>",
+        main_part="word/document2.xml",
+    )
+
+    assert list(iter_paragraph_texts(docx_path)) == ["hello"]
@@ -0,0 +1,37 @@
+import pytest
+
+from TibQA import html_parser
+
+HTML = """<html><body>
+<p><span class="span0">༡ question one</span></p>
+<p><span class="c1 span0">༢ question two</span></p>
+<p><span class="span0 c2">ལན། answer one</span></p>
+<p><span class="span01">not a span0 span</span></p>
+<p><span class="c1">no span0 class</span></p>
+<p><span class="span0">༣ question</span><span class="span0"> three</span></p>
+<div><span class="span0">ལན། outside a paragraph</span></div>
+<p><span class="span0">ལན། answer two</span></p>
+</body></html>
+"""
+
+
+@pytest.fixture(params=["bs4", "selectolax"])
+def backend(request, monkeypatch):
+    """Run the test once with BeautifulSoup and once with selectolax."""
+    if request.param == "bs4":
+        monkeypatch.setattr(html_parser, "LexborHTMLParser", None)
+    else:
+        lexbor = pytest.importorskip("selectolax.lexbor")
+        monkeypatch.setattr(html_parser, "LexborHTMLParser", lexbor.LexborHTMLParser)
+    return request.param
+
+
+def test_parse_html_matches_span0_in_class_list(backend, tmp_path):
+    html_path = tmp_path / "input.html"
+    html_path.write_text(HTML, encoding="utf-8")
+
+    questions, answers = html_parser.parse_html(html_path)
+
+    # Only the first span0 of each <p> is read, and spans outside a <p> are skipped
+    assert questions == ["༡༽ question one", "༢༽ question two", "༣༽ question"]
+    assert answers == ["༡༽ answer one", "༢༽ answer two"]
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from TibQA.qa import QA_PATTERN, extract_qa_from_docx, iter_qa_matches
+
+
+def full_text_groups(paragraphs):
+    """The Q&A groups found by matching QA_PATTERN over the whole joined text."""
+    text = "\n".join(paragraph for paragraph in paragraphs if paragraph)
+    return [match.groups() for match in QA_PATTERN.finditer(text)]
+
+
+def streamed_groups(paragraphs):
+    return [match.groups() for match in iter_qa_matches(paragraphs)]
+
+
+@pytest.mark.parametrize(
+    "paragraphs, expected",
+    [
+        # The last match runs to the end of the text
+        (["དྲི་བ། q", "ལན། a"], [("q", "a")]),
+        # A question marker without a following ལན། yields no pair
+        (["དྲི་བ། q", "ལན། a", "", "དྲི་བ། orphan"], [("q", "a\n")]),
+        # A question with no ལན། of its own runs on into the next marker
+        (["དྲི་བ། q1", "དྲི་བ། q2", "ལན། a"], [("q1\nདྲི་བ། q2", "a")]),
+        (
+            ["intro", "དྲི་བ། q1 ལན། a1 དྲི་བ། q2", "ལན།", "a2", "དྲི་བ།"],
+            [("q1", "a1 "), ("q2", "a2\n")],
+        ),
+        ([], []),
+    ],
+)
+def test_iter_qa_matches(paragraphs, expected):
+    assert streamed_groups(paragraphs) == expected
+    assert full_text_groups(paragraphs) == expected
+
+
+def test_iter_qa_matches_equals_full_text_matching():
+    tokens = ["དྲི་བ།", "ལན།", "ཀ", "ཁ་", "ག ང", " ", "\n", "༡"]
+    rng = random.Random(0)
+    for _ in range(5000):
+        # Paragraph texts come stripped from iter_paragraph_texts
+        paragraphs = [
+            "".join(rng.choices(tokens, k=rng.randint(0, 4))).strip()
+            for _ in range(rng.randint(0, 8))
+        ]
+        assert streamed_groups(paragraphs) == full_text_groups(paragraphs), paragraphs
+
+
+def test_extract_qa_from_docx_keeps_outputs_on_bad_input(tmp_path):
+    questions_path = tmp_path / "questions.txt"
+    answers_path = tmp_path / "answers.txt"
+    questions_path.write_text("previous questions", encoding="utf-8")
+    answers_path.write_text("previous answers", encoding="utf-8")
+    corrupt_path = tmp_path / "corrupt.docx"
+    corrupt_path.write_bytes(b"not a zip file")
+
+    for docx_path in (tmp_path / "missing.docx", corrupt_path):
+        assert extract_qa_from_docx(docx_path, questions_path, answers_path) == 0
+
+    assert questions_path.read_text(encoding="utf-8") == "previous questions"
+    assert answers_path.read_text(encoding="utf-8") == "previous answers"
+
+
+def test_extract_qa_from_docx(write_docx, tmp_path):
+    docx_path = write_docx(
+        "qa.docx",
+        "<w:p><w:r><w:t>དྲི་བ། ༥ first</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>ལན། answer</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>དྲི་བ། second ལན། more</w:t></w:r></w:p>",
+    )
+    questions_path = tmp_path / "out" / "questions.txt"
+    answers_path = tmp_path / "out" / "answers.txt"
+
+    assert extract_qa_from_docx(docx_path, questions_path, answers_path) == 2
+    assert questions_path.read_text(encoding="utf-8") == ("༡༽ ༥ first\n\n༢༽ second\n\n")
+    assert answers_path.read_text(encoding="utf-8") == "༡༽ answer\n\n༢༽ more\n\n"
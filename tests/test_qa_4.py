@@ -0,0 +1,31 @@
+from TibQA.qa_4 import TibetanTextProcessor
+
+
+def test_answer_keeps_soft_line_breaks(write_docx):
+    docx_path = write_docx(
+        "qa_4.docx",
+        "<w:p><w:r><w:t>༈ ཀ། question text</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>དེའི་ལན་ནི། line one</w:t><w:br/><w:t>line two</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>more</w:t></w:r></w:p>",
+    )
+
+    questions, answers = TibetanTextProcessor(debug=False).parse_docx(docx_path)
+
+    assert questions == ["1༽ question text"]
+    assert answers == ["1༽ line one\nline two\nmore"]
+
+
+def test_answer_prefixes_are_removed(write_docx):
+    docx_path = write_docx(
+        "qa_4_prefixes.docx",
+        "<w:p><w:r><w:t>༈ ཀ། first</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>དེའི་ལན་ནི། answer one</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>༈ ཁ། second</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>དེའི་དོན་ནི།answer two</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>plain དེའི་ལན་ནི།</w:t></w:r></w:p>",
+    )
+
+    questions, answers = TibetanTextProcessor(debug=False).parse_docx(docx_path)
+
+    assert questions == ["1༽ first", "2༽ second"]
+    assert answers == ["1༽ answer one", "2༽ answer two\nplain དེའི་ལན་ནི།"]
@@ -0,0 +1,22 @@
+from TibQA.qa_6 import TibetanDocProcessor
+
+
+def test_answer_keeps_soft_line_breaks(write_docx, tmp_path):
+    docx_path = write_docx(
+        "qa_6.docx",
+        "<w:p><w:r><w:t>༼༡༽ question</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>line one</w:t><w:br/><w:t>line two</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>༼༢༽ next</w:t><w:tab/><w:t>question</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>answer</w:t></w:r></w:p>",
+    )
+    questions_path = tmp_path / "questions.txt"
+    answers_path = tmp_path / "answers.txt"
+
+    TibetanDocProcessor().process_docx(docx_path, questions_path, answers_path)
+
+    assert questions_path.read_text(encoding="utf-8") == (
+        "༡༽ question\n\n༢༽ next\tquestion"
+    )
+    assert answers_path.read_text(encoding="utf-8") == (
+        "༡༽ line one\nline two\n\n༢༽ answer"
+    )
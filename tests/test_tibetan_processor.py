@@ -0,0 +1,52 @@
+from TibQA import qa_2, qa_3
+
+
+def paragraphs_xml(*texts):
+    return "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in texts)
+
+
+def test_answer_without_marker(write_docx):
+    # qa_2: every line after a numbered question is answer text
+    docx_path = write_docx(
+        "qa_2.docx",
+        paragraphs_xml(
+            "text before the first question",
+            "༡ first question",
+            "ལན།  answer after two spaces",
+            "more answer",
+            "༢ second question",
+            "second answer",
+        ),
+    )
+
+    processor = qa_2.TibetanTextProcessor(debug=False)
+    questions, answers = processor.parse_docx(docx_path)
+
+    assert questions == ["༡༽ first question", "༢༽ second question"]
+    # The text after the "ལན། " prefix is stripped
+    assert answers == ["༡༽ answer after two spaces\nmore answer", "༢༽ second answer"]
+
+
+def test_answer_marker_required(write_docx):
+    # qa_3: lines after a question continue it until a "ལན།" line opens the answer
+    docx_path = write_docx(
+        "qa_3.docx",
+        paragraphs_xml(
+            "ལན། answer before the first question",
+            "༡ first question",
+            "continued",
+            "ལན།first answer",
+            "more answer",
+            "༢ question without an answer",
+            "༣ third question",
+            "ལན། third answer",
+        ),
+    )
+
+    processor = qa_3.TibetanTextProcessor(debug=False)
+    questions, answers = processor.parse_docx(docx_path)
+
+    # Questions without an answer are dropped and not counted
+    assert questions == ["༡༽ first question continued", "༢༽ third question"]
+    # The answer before the first question does not leak into the first answer
+    assert answers == ["༡༽ first answer\nmore answer", "༢༽ third answer"]